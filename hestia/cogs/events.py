@@ -4,8 +4,10 @@ Commands:
     create_event_schedule: schedule a job for automatically creating events
     schedules: see a list of currently scheduled jobs
 """
+import asyncio
 import os
 import datetime as dt
+import typing as t
 
 import discord as d
 from discord.ext import commands
@@ -15,7 +17,15 @@ from .. import scheduler as sch
 from .. import utils
 from ..views.job import JobListView
 
-SERVER_IDS = os.getenv("HESTIA_DISCORD_SERVER_IDS").replace(" ", "").split(",")
+_RAW_SERVER_IDS = os.getenv("HESTIA_DISCORD_SERVER_IDS", "")
+# None registers the commands globally when no server is configured
+SERVER_IDS = tuple(
+    id for id in _RAW_SERVER_IDS.replace(" ", "").split(",") if id
+) or None
+# Minimum seconds between two events created in the same guild
+SEND_INTERVAL = 0.2
+# How many times to retry an event creation that was rate limited
+RATE_LIMIT_RETRIES = 3
 
 
 class Events(commands.Cog):
@@ -24,6 +34,29 @@ class Events(commands.Cog):
     def __init__(self, bot: d.Bot):
         """Initializes this Cog."""
         self.bot = bot
+        self._guilds: t.Dict[int, d.Guild] = {}
+        self._guild_locks: t.Dict[int, asyncio.Lock] = {}
+        self._last_sent: t.Dict[int, float] = {}
+
+    @commands.Cog.listener()
+    async def on_guild_available(self, guild: d.Guild) -> None:
+        """Caches a guild once it becomes available."""
+        self._guilds[guild.id] = guild
+
+    @commands.Cog.listener()
+    async def on_guild_join(self, guild: d.Guild) -> None:
+        """Caches a guild the bot has just joined."""
+        self._guilds[guild.id] = guild
+
+    @commands.Cog.listener()
+    async def on_guild_unavailable(self, guild: d.Guild) -> None:
+        """Evicts a guild that became unavailable from the cache."""
+        self._guilds.pop(guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: d.Guild) -> None:
+        """Evicts a guild the bot has left from the cache."""
+        self._guilds.pop(guild.id, None)
 
     @d.slash_command(
         description="Schedule an event",
@@ -83,14 +116,14 @@ class Events(commands.Cog):
                 return
         else:
             end_datetime = None
-        user_id = str(ctx.user.id)
+        user_id = ctx.user.id
         job_id = f"{user_id}_{ctx.interaction.id}"
         event_kwargs = {
             "guild_id": ctx.guild_id,
             "event_name": name,
             "location": location,
         }
-        freq = sch.JobFrequency(repeat)
+        freq = sch.FREQUENCY_BY_VALUE[repeat]
         if (sch.JobFrequency.ONCE == freq):
             run_date = start_datetime - dt.timedelta(hours=hours_before)
             event_kwargs["start_datetime"] = start_datetime
@@ -101,7 +134,12 @@ class Events(commands.Cog):
                 run_date=max(run_date, utils.now()),
                 kwargs=event_kwargs,
             )
-        elif (freq.is_interval):
+        elif (freq.is_interval()):
+            if hours_before <= 0:
+                await ctx.respond("Repeating events need to be created at "
+                                  "least one hour before they start",
+                                  ephemeral=True)
+                return
             job = sch.Job(
                 id=job_id,
                 name=f"Create event '{name}'",
@@ -109,15 +147,23 @@ class Events(commands.Cog):
                 user_id=user_id,
                 username=ctx.author.name,
             )
-            start_date = start_datetime - dt.timedelta(hours=hours_before)
+            lead_time = dt.timedelta(hours=hours_before)
+            start_date = start_datetime - lead_time
             event_kwargs["first_start"] = start_datetime
-            event_kwargs["first_end"] = end_datetime
-            event_kwargs["hours_until"] = hours_before
-            sch.create_interval(
+            event_kwargs["duration"] = (end_datetime - start_datetime
+                                        if end_datetime is not None
+                                        else None)
+            event_kwargs["lead_time"] = lead_time
+            day_of_week = (start_date.weekday()
+                           if sch.JobFrequency.WEEKLY == freq else "*")
+            sch.create_cron(
                 self._create_event,
                 job,
                 start_date=start_date,
                 next_run_time=max(start_date, utils.now()),
+                hour=start_date.hour,
+                minute=start_date.minute,
+                day_of_week=day_of_week,
                 kwargs=event_kwargs
             )
         await ctx.respond("Successfully created schedule", ephemeral=True)
@@ -149,7 +195,7 @@ class Events(commands.Cog):
         if ctx.author.guild_permissions.administrator:
             jobs = sch.get_all()
         else:
-            jobs = sch.find(str(ctx.user.id))
+            jobs = sch.find(ctx.user.id)
         if len(jobs) == 0:
             await ctx.respond("These are no scheduled jobs", ephemeral=True)
         else:
@@ -173,16 +219,25 @@ class Events(commands.Cog):
             start_datetime: start of the event
             end_datetime: end ot the event
         """
-        guild = self.bot.get_guild(guild_id)
-        if end_datetime is None:
-            await guild.create_scheduled_event(name=event_name,
-                                               start_time=start_datetime,
-                                               location=location)
-        else:
-            await guild.create_scheduled_event(name=event_name,
-                                               start_time=start_datetime,
-                                               end_time=end_datetime,
-                                               location=location)
+        guild = self._guilds.get(guild_id) or self.bot.get_guild(guild_id)
+        event_kwargs = {
+            "name": event_name,
+            "start_time": start_datetime,
+            "location": location,
+        }
+        if end_datetime is not None:
+            event_kwargs["end_time"] = end_datetime
+        loop = asyncio.get_running_loop()
+        lock = self._guild_locks.setdefault(guild_id, asyncio.Lock())
+        async with lock:
+            delay = (self._last_sent.get(guild_id, 0) + SEND_INTERVAL
+                     - loop.time())
+            if delay > 0:
+                await asyncio.sleep(delay)
+            try:
+                await _create_scheduled_event(guild, event_kwargs)
+            finally:
+                self._last_sent[guild_id] = loop.time()
 
     async def _create_event(
         self,
@@ -190,8 +245,8 @@ class Events(commands.Cog):
         event_name: str,
         location: d.ScheduledEventLocation,
         first_start: dt.datetime,
-        first_end: dt.datetime,
-        hours_until: int,
+        duration: t.Optional[dt.timedelta],
+        lead_time: dt.timedelta,
     ) -> None:
         """Creates an event in discord in the context of a scheduled job.
 
@@ -203,26 +258,50 @@ class Events(commands.Cog):
             event_name: name of the event.
             location: can be a string, a voice channel or a stage channel.
             first_start: when will the first event start.
-            firs_end: when will gthe first event end.
-            hours_until: how many hours from now will the event start
+            duration: how long the event lasts, None if it has no end.
+            lead_time: how long from now will the event start.
         """
         now = utils.now()
         if now < first_start:
             start_date = first_start
-            end_date = first_end
         else:
-            start_date = now + dt.timedelta(hours=hours_until)
-            start_date.replace(
-                hour=first_start.hour,
-                minute=first_start.minute,
-                second=first_start.second,
-            )
-            end_date = (start_date + (first_end - first_start)
-                        if first_end is not None else None)
+            start_date = now + lead_time
+            # the trigger fires on the minute, only drop the firing delay
+            # by going back to the latest start at first_start's time of
+            # day, unless the job ran so late that this start is past
+            delay = (start_date - first_start) % dt.timedelta(days=1)
+            snapped_date = start_date - delay
+            if now < snapped_date:
+                start_date = snapped_date
+        end_date = start_date + duration if duration is not None else None
         await self._create_single_event(guild_id, event_name, location,
                                         start_date, end_date)
 
 
+async def _create_scheduled_event(guild: d.Guild, event_kwargs: dict) -> None:
+    """Creates a scheduled event, backing off when rate limited.
+
+    Args:
+        guild: where the event will be created.
+        event_kwargs: kwargs passed to guild.create_scheduled_event.
+
+    Raises:
+        HTTPException: if the request failed for any other reason than
+            rate limiting, or it was still rate limited after retrying.
+    """
+    for attempt in range(RATE_LIMIT_RETRIES + 1):
+        try:
+            await guild.create_scheduled_event(**event_kwargs)
+            return
+        except d.HTTPException as e:
+            if 429 != e.status or attempt == RATE_LIMIT_RETRIES:
+                raise
+            retry_after = float(e.response.headers.get("Retry-After", 1))
+            logger.warning(f"Rate limited on guild {guild.id}, "
+                           f"retrying in {retry_after}s")
+            await asyncio.sleep(retry_after)
+
+
 def setup(bot: d.Bot) -> None:
     """Integrates this cog into the bot"""
     bot.add_cog(Events(bot))
@@ -4,9 +4,12 @@ import os
 import discord as d
 from loguru import logger
 
+from . import scheduler as sch
+
 dotenv.load_dotenv()
 
 bot = d.Bot()
 bot.load_extension('hestia.cogs.events')
+sch.start()
 with logger.catch():
     bot.run(os.getenv('HESTIA_DISCORD_TOKEN'))
@@ -2,31 +2,43 @@
 
 Only this module should interact direclty with the apscheduler.
 This module also mantains a friendlier cache of the currently existing
-jobs and can be asked about them.
+jobs and can be asked about them. The cache follows the apscheduler: a
+job is dropped from it whenever the apscheduler removes the job.
 
 Typical usage example:
 
+    start()
     job_id = "..."
-    user_id = "..."
+    user_id = ...
     job = Job(id=job_id, user_id=user_id, ...)
-    create_interval(func, job, ...)
+    create_cron(func, job, ...)
     ...
-    remove(job_id, user_id)
+    remove(job_id)
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import datetime as dt
 import enum
 from itertools import chain
 import typing as t
 import zoneinfo
 
+from apscheduler.events import EVENT_JOB_REMOVED, JobEvent
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
+if t.TYPE_CHECKING:
+    import discord as d
+
 
 _scheduler = AsyncIOScheduler()
-_scheduler.start()
 TZ_ARGENTINA = zoneinfo.ZoneInfo("America/Buenos_Aires")
-_USER_JOBS = {}
+_USER_JOBS: t.Dict[int, t.Dict[str, "Job"]] = {}
+# Options shared by every job: re-adding an id replaces the old job, and
+# runs missed by less than an hour still happen, but only once.
+_JOB_OPTIONS = {
+    "replace_existing": True,
+    "misfire_grace_time": 3600,
+    "coalesce": True,
+}
 
 
 class JobFrequency(enum.StrEnum):
@@ -35,17 +47,13 @@ class JobFrequency(enum.StrEnum):
     WEEKLY = enum.auto()
     DAILY = enum.auto()
 
-    def days(self) -> int:
-        """Returns how many days between job execution"""
-        return 1 if self is JobFrequency.DAILY else 0
+    def is_interval(self) -> bool:
+        """Returns True if the job repeats with a fixed frequency."""
+        return self in _INTERVAL_FREQUENCIES
 
-    def weeks(self) -> int:
-        """Returns how many months between job execution"""
-        return 1 if self is JobFrequency.WEEKLY else 0
 
-    def is_interval(self) -> bool:
-        """Returns True if the trigger will be of interval type."""
-        return self in [JobFrequency.DAILY, JobFrequency.WEEKLY]
+_INTERVAL_FREQUENCIES = frozenset({JobFrequency.DAILY, JobFrequency.WEEKLY})
+FREQUENCY_BY_VALUE = {e.value: e for e in JobFrequency}
 
 
 @dataclass
@@ -58,26 +66,48 @@ class Job:
         freq: the frequency of execution.
         user_id: who requested the job.
         create_date: when was the job created.
+        option: cached select option used by the views, built on demand.
     """
     id: str
     name: str
     freq: JobFrequency
-    user_id: str
+    user_id: int
     username: str
-    create_date: dt.datetime = dt.datetime.now(TZ_ARGENTINA)
+    create_date: dt.datetime = field(
+        default_factory=lambda: dt.datetime.now(TZ_ARGENTINA))
+    option: t.Optional["d.SelectOption"] = field(
+        default=None, init=False, repr=False, compare=False)
 
     def description(self) -> str:
         return f"Frequency: {self.freq.value} -- User: {self.username}"
 
 
+def start() -> None:
+    """Starts the apscheduler if it is not already running.
+
+    Jobs created before starting are kept and run once it starts.
+    """
+    if not _scheduler.running:
+        _scheduler.start()
+
+
 def get_all() -> t.List[Job]:
     """Return all the scheduled jobs."""
-    return list(chain.from_iterable(_USER_JOBS.values()))
+    return list(chain.from_iterable(
+        jobs.values() for jobs in _USER_JOBS.values()))
 
 
-def find(user_id: str) -> t.List[Job]:
+def find(user_id: int) -> t.List[Job]:
     """Returns the jobs scheduled by an user."""
-    return _USER_JOBS.get(user_id)
+    return list(_USER_JOBS.get(user_id, {}).values())
+
+
+def get(id: str) -> t.Optional[Job]:
+    """Returns the job with the given id, or None if there is none."""
+    user_id = _user_id(id)
+    if user_id is None:
+        return None
+    return _USER_JOBS.get(user_id, {}).get(id)
 
 
 def create_oneoff(
@@ -95,17 +125,20 @@ def create_oneoff(
         kwargs: kwargs that will be passed to func.
     """
     _scheduler.add_job(func, "date", kwargs=kwargs, id=job_id,
-                       run_date=run_date)
+                       run_date=run_date, **_JOB_OPTIONS)
 
 
-def create_interval(
+def create_cron(
     func: t.Callable[..., t.Awaitable[None]],
     job: Job,
     start_date: dt.datetime,
     next_run_time: dt.datetime,
+    hour: int,
+    minute: int,
+    day_of_week: t.Union[int, str],
     kwargs: dict,
 ) -> None:
-    """Schedules a job to run indefinetly with a given frequency.
+    """Schedules a job to run indefinetly at a given time of the day.
 
     This function creates a job with the apscheduler and also adds
     it to the internal cache.
@@ -113,19 +146,43 @@ def create_interval(
     Args:
         func: async function to be ran each time the job fires.
         job: information about the job.
-        start_date: datetime to start counting the interval from.
+        start_date: datetime before which the job will not fire.
         next_run_time: when to run func for the first time.
+        hour: hour of the day to run func at.
+        minute: minute of the hour to run func at.
+        day_of_week: weekday to run func at (0 is monday) or "*".
         kwargs: kwargs that will be passed to func.
     """
-    _scheduler.add_job(func, "interval", kwargs=kwargs, id=job.id,
-                       weeks=job.freq.weeks(), days=job.freq.days(),
-                       start_date=start_date, next_run_time=next_run_time)
-    if _USER_JOBS.get(job.user_id) is None:
-        _USER_JOBS[job.user_id] = []
-    _USER_JOBS[job.user_id].append(job)
+    _scheduler.add_job(func, "cron", kwargs=kwargs, id=job.id,
+                       hour=hour, minute=minute, day_of_week=day_of_week,
+                       start_date=start_date, timezone=start_date.tzinfo,
+                       next_run_time=next_run_time, **_JOB_OPTIONS)
+    _USER_JOBS.setdefault(job.user_id, {})[job.id] = job
 
 
-def remove(id: str, user_id: str) -> None:
-    """Removes the job from the apscheduler and from internal cache."""
+def remove(id: str) -> None:
+    """Removes the job from the apscheduler, which evicts it from cache."""
     _scheduler.remove_job(id)
-    _USER_JOBS[user_id] = [j for j in _USER_JOBS[user_id] if j.id != id]
+
+
+def _user_id(job_id: str) -> t.Optional[int]:
+    """Returns the id of the user who requested the job.
+
+    Job ids are expected to look like '<user_id>_<interaction_id>', None
+    is returned for any other id.
+    """
+    user_id, _, _ = job_id.partition("_")
+    try:
+        return int(user_id)
+    except ValueError:
+        return None
+
+
+def _on_job_removed(event: JobEvent) -> None:
+    """Drops a job removed from the apscheduler from the internal cache."""
+    user_id = _user_id(event.job_id)
+    if user_id is not None:
+        _USER_JOBS.get(user_id, {}).pop(event.job_id, None)
+
+
+_scheduler.add_listener(_on_job_removed, EVENT_JOB_REMOVED)
@@ -1,4 +1,5 @@
 import datetime as dt
+import functools
 import os
 import zoneinfo
 
@@ -18,6 +19,12 @@ def now() -> dt.datetime:
     return dt.datetime.now(TIMEZONE)
 
 
+@functools.lru_cache(maxsize=256)
+def _parse_datetime(argument: str) -> dt.datetime:
+    """Returns the timezone aware datetime of an iso formatted string."""
+    return dt.datetime.fromisoformat(argument).astimezone(TIMEZONE)
+
+
 class DateConverter(commands.Converter):
     """Converts from string to datetime.
 
@@ -32,10 +39,10 @@ class DateConverter(commands.Converter):
             BadArgument: if the datatime conversion failed.
         """
         try:
-            return dt.datetime.fromisoformat(argument).astimezone(TIMEZONE)
-        except Exception:
+            return _parse_datetime(argument)
+        except (ValueError, TypeError) as e:
             raise commands.BadArgument(
                 f"Sorry, I don't understand the date '{argument}'. "
                 "Please use the format [YYYY-MM-DD HH:mm]\n"
                 "Example: 2009-01-03 14:15"
-            )
+            ) from e
@@ -37,54 +37,67 @@ class JobListView(d.ui.View):
         Returns:
             The newly created selection list
         """
-        async def callback(interaction: d.Interaction):
-            """Executes when a Job is selected.
-
-            Hides the selection list and asks if the user wants to
-            remove the selected job.
-            """
-            self.remove_item(self._job_select)
-            self.add_item(self._create_remove())
-            self.add_item(self._create_cancel())
-            await interaction.response.edit_message(
-                content="Do you want to remove the selected schedule?",
-                view=self
-            )
         select = d.ui.Select(placeholder="Select a schedule job",
                              row=0,
                              options=[_select_option(job) for job in jobs])
-        select.callback = callback
+        select.callback = self._on_select
         return select
 
     def _create_remove(self) -> d.ui.Button:
         """Returns the remove button."""
-        async def callback(interaction: d.Interaction):
-            """Un-schedules the selected job."""
-            self.clear_items()
-            selected_id = self._job_select.values[0]
-            user_id = selected_id.split('_')[0]
-            sch.remove(selected_id, user_id)
-            await interaction.response.edit_message(content="Job removed",
-                                                    view=self)
         btn = d.ui.Button(style=d.ButtonStyle.danger, label="Remove", row=0)
-        btn.callback = callback
+        btn.callback = self._on_remove
         return btn
 
     def _create_cancel(self) -> d.ui.Button:
         """Returns the cancel button."""
-        async def callback(interaction: d.Interaction):
-            """Clears the buttons and the selection."""
-            self.clear_items()
+        btn = d.ui.Button(style=d.ButtonStyle.grey, label='Cancel', row=0)
+        btn.callback = self._on_cancel
+        return btn
+
+    async def _on_select(self, interaction: d.Interaction) -> None:
+        """Executes when a Job is selected.
+
+        Hides the selection list and asks if the user wants to
+        remove the selected job.
+        """
+        self.remove_item(self._job_select)
+        self.add_item(self._create_remove())
+        self.add_item(self._create_cancel())
+        await interaction.response.edit_message(
+            content="Do you want to remove the selected schedule?",
+            view=self
+        )
+
+    async def _on_remove(self, interaction: d.Interaction) -> None:
+        """Un-schedules the selected job."""
+        self.clear_items()
+        job = sch.get(self._job_select.values[0])
+        if job is None:
             await interaction.response.edit_message(
-                content='No job was removed',
+                content="Job was already removed",
                 view=self,
             )
-        btn = d.ui.Button(style=d.ButtonStyle.grey, label='Cancel', row=0)
-        btn.callback = callback
-        return btn
+            return
+        sch.remove(job.id)
+        await interaction.response.edit_message(content="Job removed",
+                                                view=self)
+
+    async def _on_cancel(self, interaction: d.Interaction) -> None:
+        """Clears the buttons and the selection."""
+        self.clear_items()
+        await interaction.response.edit_message(
+            content='No job was removed',
+            view=self,
+        )
 
 
 def _select_option(job: sch.Job) -> d.SelectOption:
-    """Returns a discord select option representing a job."""
-    return d.SelectOption(label=job.name, value=job.id,
-                          description=job.description())
+    """Returns a discord select option representing a job.
+
+    The option is built once and cached on the job.
+    """
+    if job.option is None:
+        job.option = d.SelectOption(label=job.name, value=job.id,
+                                    description=job.description())
+    return job.option